@@ -698,7 +698,7 @@ class ErmesQGISDialog(QDockWidget):
         if not self.access_token:
             return
 
-        if not self.token_manager.check_and_handle_expiration():
+        if not self.token_manager.check_and_handle_expiration(validate_with_api=True):
             # Token is expired, perform automatic logout
             self.perform_logout()
             self.update_status("Session expired. Please login again.", "warning")
@@ -1020,15 +1020,17 @@ class ErmesQGISDialog(QDockWidget):
                 )
                 return
 
-            # Start asynchronous download
-            self.start_job_download_task(job_id)
+            # Start asynchronous download; the jobs list already carries the datatype_id
+            self.start_job_download_task(
+                job_id, job_data.get("body", {}).get("datatype_id")
+            )
 
         except Exception as e:
             self.update_status(
                 f"Internal error processing job from row {row}: {e}", "error"
             )
 
-    def start_job_download_task(self, job_id):
+    def start_job_download_task(self, job_id, datatype_id=None):
         """Start a QgsTask for downloading the job resource asynchronously"""
         try:
             description = f"Downloading job {job_id}"
@@ -1041,6 +1043,7 @@ class ErmesQGISDialog(QDockWidget):
                 access_token=self.access_token,
                 dialog_ref=self,
                 config=self.config,
+                datatype_id=datatype_id,
             )
 
             # Add the task to QGIS task manager
@@ -0,0 +1,48 @@
+# coding=utf-8
+"""Date utilities test.
+
+.. note:: This program is free software; you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation; either version 2 of the License, or
+     (at your option) any later version.
+
+"""
+
+__author__ = 'gaetano.chiriaco@linksfoundation.com'
+__date__ = '2026-10-14'
+__copyright__ = 'Copyright 2025, Gaetano Chiriaco - Links Foundation'
+
+import unittest
+
+from utils.date_utils import parse_date
+
+
+class ParseDateTest(unittest.TestCase):
+    """Test dates are normalized to YYYY-MM-DD."""
+
+    def test_date_only(self):
+        """Test a plain date is returned unchanged."""
+        self.assertEqual(parse_date('2024-03-15'), '2024-03-15')
+
+    def test_datetime(self):
+        """Test datetimes are truncated to their date."""
+        self.assertEqual(parse_date('2024-03-15T10:30:00'), '2024-03-15')
+        self.assertEqual(parse_date('2024-03-15 10:30:00.123456'), '2024-03-15')
+        self.assertEqual(parse_date('2024-03-15T23:30:00+02:00'), '2024-03-15')
+
+    def test_empty(self):
+        """Test an empty string is passed through."""
+        self.assertEqual(parse_date(''), '')
+
+    def test_invalid(self):
+        """Test unparseable dates give None."""
+        self.assertIsNone(parse_date('2024-13-01'))
+        self.assertIsNone(parse_date('15/03/2024'))
+        self.assertIsNone(parse_date('2024-03-15T25:00:00'))
+        self.assertIsNone(parse_date('not a date'))
+
+
+if __name__ == "__main__":
+    suite = unittest.makeSuite(ParseDateTest)
+    runner = unittest.TextTestRunner(verbosity=2)
+    runner.run(suite)
@@ -0,0 +1,76 @@
+# coding=utf-8
+"""HTTP utilities test.
+
+.. note:: This program is free software; you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation; either version 2 of the License, or
+     (at your option) any later version.
+
+"""
+
+__author__ = 'gaetano.chiriaco@linksfoundation.com'
+__date__ = '2026-10-14'
+__copyright__ = 'Copyright 2025, Gaetano Chiriaco - Links Foundation'
+
+import unittest
+
+from utils.http_utils import filename_from_response
+
+
+class FakeResponse(object):
+    """Minimal stand-in exposing only the response headers."""
+
+    def __init__(self, content_disposition=None):
+        self.headers = {}
+        if content_disposition is not None:
+            self.headers['Content-Disposition'] = content_disposition
+
+
+class FilenameFromResponseTest(unittest.TestCase):
+    """Test Content-Disposition filenames are parsed and sanitized."""
+
+    def filename(self, content_disposition):
+        return filename_from_response(
+            FakeResponse(content_disposition), 'default.zip')
+
+    def test_quoted_and_plain_filename(self):
+        """Test quoted and unquoted filenames are returned as-is."""
+        self.assertEqual(
+            self.filename('attachment; filename="result 1.zip"'), 'result 1.zip')
+        self.assertEqual(
+            self.filename('attachment; filename=result.zip'), 'result.zip')
+
+    def test_rfc5987_filename(self):
+        """Test filename*= values are percent-decoded."""
+        self.assertEqual(
+            self.filename("attachment; filename*=UTF-8''%C3%A9t%C3%A9.zip"),
+            u'\u00e9t\u00e9.zip')
+
+    def test_relative_traversal_is_stripped(self):
+        """Test parent directory components are removed."""
+        self.assertEqual(
+            self.filename('attachment; filename="../../x"'), 'x')
+        self.assertEqual(
+            self.filename('attachment; filename="..\\\\..\\\\x.zip"'), 'x.zip')
+
+    def test_absolute_path_is_stripped(self):
+        """Test absolute paths are reduced to their basename."""
+        self.assertEqual(
+            self.filename('attachment; filename="/etc/passwd"'), 'passwd')
+        self.assertEqual(
+            self.filename('attachment; filename="C:\\\\Windows\\\\x.zip"'), 'x.zip')
+
+    def test_unusable_names_fall_back(self):
+        """Test missing, empty, '.' and '..' names use the default."""
+        self.assertEqual(self.filename(None), 'default.zip')
+        self.assertEqual(self.filename('attachment'), 'default.zip')
+        self.assertEqual(self.filename('attachment; filename=""'), 'default.zip')
+        self.assertEqual(self.filename('attachment; filename="."'), 'default.zip')
+        self.assertEqual(self.filename('attachment; filename=".."'), 'default.zip')
+        self.assertEqual(self.filename('attachment; filename="../"'), 'default.zip')
+
+
+if __name__ == "__main__":
+    suite = unittest.makeSuite(FilenameFromResponseTest)
+    runner = unittest.TextTestRunner(verbosity=2)
+    runner.run(suite)
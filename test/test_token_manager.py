@@ -0,0 +1,225 @@
+# coding=utf-8
+"""Token manager test.
+
+.. note:: This program is free software; you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation; either version 2 of the License, or
+     (at your option) any later version.
+
+"""
+
+__author__ = 'gaetano.chiriaco@linksfoundation.com'
+__date__ = '2026-10-14'
+__copyright__ = 'Copyright 2025, Gaetano Chiriaco - Links Foundation'
+
+import base64
+import importlib.util
+import json
+import os
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+# Load the module file directly: importing the workers package would pull in
+# the other workers and their package-relative imports
+_TOKEN_MANAGER_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    'workers', 'token_manager.py')
+_spec = importlib.util.spec_from_file_location('token_manager', _TOKEN_MANAGER_PATH)
+token_manager = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(token_manager)
+
+
+def make_jwt(payload):
+    """Build an unsigned JWT-shaped token carrying the given payload."""
+    segment = base64.urlsafe_b64encode(
+        json.dumps(payload).encode('utf-8')).decode('ascii').rstrip('=')
+    return 'eyJhbGciOiJIUzI1NiJ9.{}.signature'.format(segment)
+
+
+class JwtExpiryTest(unittest.TestCase):
+    """Test the exp claim is decoded from JWTs."""
+
+    def test_numeric_exp(self):
+        """Test integer and float exp claims are returned as floats."""
+        self.assertEqual(token_manager.jwt_expiry(make_jwt({'exp': 1700000000})), 1700000000.0)
+        self.assertEqual(token_manager.jwt_expiry(make_jwt({'exp': 1700000000.5})), 1700000000.5)
+
+    def test_numeric_string_exp(self):
+        """Test a numeric string exp claim is rejected (NumericDate is a JSON number)."""
+        self.assertIsNone(token_manager.jwt_expiry(make_jwt({'exp': '1700000000'})))
+
+    def test_non_jwt(self):
+        """Test tokens that are not JWTs give None."""
+        self.assertIsNone(token_manager.jwt_expiry('opaque-token'))
+        self.assertIsNone(token_manager.jwt_expiry('a.!!!.c'))
+        self.assertIsNone(token_manager.jwt_expiry('a.bm90LWpzb24.c'))
+        self.assertIsNone(token_manager.jwt_expiry(''))
+        self.assertIsNone(token_manager.jwt_expiry(None))
+
+    def test_missing_exp(self):
+        """Test a JWT without an exp claim gives None."""
+        self.assertIsNone(token_manager.jwt_expiry(make_jwt({'sub': 'user'})))
+
+    def test_non_numeric_exp(self):
+        """Test non-numeric exp claims give None."""
+        self.assertIsNone(token_manager.jwt_expiry(make_jwt({'exp': 'tomorrow'})))
+        self.assertIsNone(token_manager.jwt_expiry(make_jwt({'exp': None})))
+        self.assertIsNone(token_manager.jwt_expiry(make_jwt({'exp': [1]})))
+        self.assertIsNone(token_manager.jwt_expiry(make_jwt({'exp': True})))
+
+    def test_non_finite_exp(self):
+        """Test infinite and NaN exp claims are rejected."""
+        self.assertIsNone(token_manager.jwt_expiry(make_jwt({'exp': 'inf'})))
+        self.assertIsNone(token_manager.jwt_expiry(make_jwt({'exp': 'nan'})))
+        # json.dumps writes these as the non-standard Infinity/NaN literals json.loads accepts
+        self.assertIsNone(token_manager.jwt_expiry(make_jwt({'exp': float('inf')})))
+        self.assertIsNone(token_manager.jwt_expiry(make_jwt({'exp': float('nan')})))
+
+
+
+class FakeClock(object):
+    """Controllable replacement for the time module used by token_manager."""
+
+    def __init__(self, wall=1700000000.0, monotonic=1000.0):
+        self.wall = wall
+        self.mono = monotonic
+
+    def time(self):
+        return self.wall
+
+    def monotonic(self):
+        return self.mono
+
+    def advance(self, seconds):
+        self.wall += seconds
+        self.mono += seconds
+
+
+def make_config(lifetime_minutes=6000, buffer_minutes=5):
+    """Build the subset of ConfigLoader read by TokenManager."""
+    return SimpleNamespace(
+        token_lifetime_minutes=lifetime_minutes,
+        token_expiration_buffer_minutes=buffer_minutes,
+        token_api_validation_timeout=10,
+        api_endpoints={'jobs_list': '/jobs/'},
+    )
+
+
+class TokenManagerTest(unittest.TestCase):
+    """Test token lifetime derivation and expiry."""
+
+    def setUp(self):
+        """Runs before each test."""
+        self.clock = FakeClock()
+        patcher = mock.patch.object(token_manager, 'time', self.clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def make_manager(self, refresh_ratio=None, **config):
+        return token_manager.TokenManager(
+            'https://api.example', make_config(**config), refresh_ratio=refresh_ratio)
+
+    def test_lifetime_without_exp_uses_config(self):
+        """Test opaque tokens and JWTs without exp use the configured lifetime."""
+        manager = self.make_manager()
+        manager.set_token('opaque-token')
+        self.assertEqual(manager.token_lifetime_minutes, 6000)
+        manager.set_token(make_jwt({'sub': 'user'}))
+        self.assertEqual(manager.token_lifetime_minutes, 6000)
+
+    def test_lifetime_from_exp_and_local_clock(self):
+        """Test exp without iat is measured against the local clock."""
+        manager = self.make_manager()
+        manager.set_token(make_jwt({'exp': self.clock.wall + 1800}))
+        self.assertAlmostEqual(manager.token_lifetime_minutes, 30.0)
+
+    def test_lifetime_from_exp_minus_iat_ignores_skew(self):
+        """Test exp - iat is used when present, independent of the client clock."""
+        manager = self.make_manager()
+        iat = self.clock.wall - 25 * 60  # client clock 25 minutes ahead of the server
+        manager.set_token(make_jwt({'iat': iat, 'exp': iat + 1800}))
+        self.assertAlmostEqual(manager.token_lifetime_minutes, 30.0)
+
+    def test_exp_in_the_past_uses_config(self):
+        """Test an exp already passed on the local clock falls back to the config."""
+        manager = self.make_manager()
+        manager.set_token(make_jwt({'exp': self.clock.wall - 10}))
+        self.assertEqual(manager.token_lifetime_minutes, 6000)
+        self.assertFalse(manager.is_token_expired())
+
+    def test_implausibly_short_lifetime_uses_config(self):
+        """Test lifetimes below the plausibility floor fall back to the config."""
+        manager = self.make_manager()
+        manager.set_token(make_jwt({'exp': self.clock.wall + 30}))
+        self.assertEqual(manager.token_lifetime_minutes, 6000)
+        iat = self.clock.wall
+        manager.set_token(make_jwt({'iat': iat, 'exp': iat + 30}))
+        self.assertEqual(manager.token_lifetime_minutes, 6000)
+
+    def test_explicit_lifetime_wins(self):
+        """Test an explicit lifetime_minutes overrides the token claims."""
+        manager = self.make_manager()
+        manager.set_token(make_jwt({'exp': self.clock.wall + 1800}), lifetime_minutes=90)
+        self.assertEqual(manager.token_lifetime_minutes, 90)
+
+    def test_no_token_is_expired(self):
+        """Test a manager without a token reports it as expired."""
+        self.assertTrue(self.make_manager().is_token_expired())
+
+    def test_expires_at_buffer_without_ratio(self):
+        """Test tokens expire buffer_minutes before their lifetime without a ratio."""
+        manager = self.make_manager(lifetime_minutes=60)
+        manager.set_token('opaque-token')
+        self.clock.advance(55 * 60 - 1)
+        self.assertFalse(manager.is_token_expired())
+        self.clock.advance(1)
+        self.assertTrue(manager.is_token_expired())
+
+    def test_expires_at_ratio_when_it_comes_first(self):
+        """Test the refresh ratio applies when it comes before the buffer."""
+        manager = self.make_manager(refresh_ratio=0.8, lifetime_minutes=60)
+        manager.set_token('opaque-token')
+        self.clock.advance(48 * 60 - 1)
+        self.assertFalse(manager.is_token_expired())
+        self.clock.advance(1)
+        self.assertTrue(manager.is_token_expired())
+
+    def test_expires_at_buffer_when_it_comes_first(self):
+        """Test the buffer applies when it comes before the refresh ratio."""
+        manager = self.make_manager(refresh_ratio=0.8, lifetime_minutes=10)
+        manager.set_token('opaque-token')
+        self.clock.advance(5 * 60 - 1)
+        self.assertFalse(manager.is_token_expired())
+        self.clock.advance(1)
+        self.assertTrue(manager.is_token_expired())
+
+    def test_token_shorter_than_buffer_keeps_a_window(self):
+        """Test tokens shorter than the buffer are not expired immediately."""
+        manager = self.make_manager(lifetime_minutes=3)
+        manager.set_token('opaque-token')
+        self.assertFalse(manager.is_token_expired())
+        self.clock.advance(3 * 60)
+        self.assertTrue(manager.is_token_expired())
+
+        manager = self.make_manager(refresh_ratio=0.8, lifetime_minutes=3)
+        manager.set_token('opaque-token')
+        self.clock.advance(2.4 * 60 - 1)
+        self.assertFalse(manager.is_token_expired())
+        self.clock.advance(1)
+        self.assertTrue(manager.is_token_expired())
+
+    def test_wall_clock_jump_does_not_expire(self):
+        """Test token age follows the monotonic clock, not the wall clock."""
+        manager = self.make_manager(lifetime_minutes=60)
+        manager.set_token('opaque-token')
+        self.clock.wall += 24 * 3600
+        self.assertFalse(manager.is_token_expired())
+
+
+if __name__ == "__main__":
+    suite = unittest.TestSuite()
+    suite.addTests(unittest.makeSuite(JwtExpiryTest))
+    suite.addTests(unittest.makeSuite(TokenManagerTest))
+    runner = unittest.TextTestRunner(verbosity=2)
+    runner.run(suite)
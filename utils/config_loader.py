@@ -1,23 +1,27 @@
 # -*- coding: utf-8 -*-
 """
 Configuration loader utility for the ERMES QGIS plugin.
-Loads configuration from config.yml file.
+Loads configuration from config.yml file, using a config.json mirror
+of it as a parse cache.
 """
+import json
 import os
-try:
-    import yaml
-    YAML_AVAILABLE = True
-except ImportError:
-    YAML_AVAILABLE = False
-    import json
-from typing import Dict, Any
+import tempfile
+from functools import cached_property
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Tuple
 
 
 class ConfigLoader:
-    """Singleton class to load and manage plugin configuration."""
+    """
+    Singleton class to load and manage plugin configuration.
+    Mapping and sequence sections are returned as read-only views
+    (MappingProxyType / tuple), so callers can share them without copying.
+    """
     
     _instance = None
-    _config = None
+    _initialized = False
+    _config_data = None
     
     def __new__(cls):
         if cls._instance is None:
@@ -25,158 +29,276 @@ class ConfigLoader:
         return cls._instance
     
     def __init__(self):
-        if self._config is None:
-            self._config = self._load_config()
+        # Python calls __init__ on every ConfigLoader() call; only the first one does any work.
+        # Configuration itself is loaded lazily on first access, see _config
+        if ConfigLoader._initialized:
+            return
+        # Get the plugin root directory
+        self._plugin_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        ConfigLoader._initialized = True
+
+    @property
+    def _config(self) -> Dict[str, Any]:
+        """Get the raw configuration, loading it on first access."""
+        if self._config_data is None:
+            self._config_data = self._load_config()
+        return self._config_data
     
     def _load_config(self) -> Dict[str, Any]:
         """Load configuration from config.yml file."""
+        error_type = "YAML"
         try:
-            # Get the plugin root directory
-            plugin_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+            plugin_dir = self._plugin_dir
             config_path = os.path.join(plugin_dir, "config.yml")
             
-            if not os.path.exists(config_path):
+            try:
+                stat = os.stat(config_path)
+            except FileNotFoundError:
                 raise FileNotFoundError(
                     f"Configuration file not found: {config_path}. "
                     "Please ensure config.yml exists in the plugin root directory."
                 )
-            
+
+            # Prefer the JSON mirror of config.yml while it is up to date
+            json_path = os.path.join(plugin_dir, "config.json")
+            config = self._read_json_cache(json_path, stat.st_mtime_ns)
+            if config is not None:
+                return config
+
+            try:
+                import yaml
+                # Prefer the libyaml-backed loader when PyYAML was built with it
+                Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+                error_type = f"YAML ({Loader.__name__})"
+            except ImportError:
+                yaml = None
+                error_type = "JSON"
+
             with open(config_path, 'r', encoding='utf-8') as f:
-                if YAML_AVAILABLE:
-                    config = yaml.safe_load(f)
+                if yaml is not None:
+                    config = yaml.load(f, Loader=Loader)
                 else:
                     # Fallback to JSON parsing if YAML is not available
-                    import json
                     config = json.load(f)
             
             if config is None:
                 raise ValueError("Configuration file is empty or invalid.")
-            
+
+            if yaml is not None:
+                self._write_json_cache(json_path, config)
             return config
         
         except (ValueError, FileNotFoundError) as e:
             # Re-raise these specific exceptions
             raise
         except Exception as e:
-            error_type = "YAML" if YAML_AVAILABLE else "JSON"
             raise RuntimeError(f"Failed to load {error_type} configuration: {e}")
+
+    @staticmethod
+    def _read_json_cache(json_path, source_mtime_ns):
+        """
+        Read the configuration from the config.json mirror of config.yml.
+        Returns None if the mirror is missing, older than config.yml or unreadable.
+        """
+        try:
+            if os.stat(json_path).st_mtime_ns < source_mtime_ns:
+                return None
+            with open(json_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except Exception:
+            return None
+
+    @staticmethod
+    def _write_json_cache(json_path, config):
+        """
+        Atomically write the parsed configuration to the config.json mirror.
+        The mirror is skipped unless JSON reproduces the configuration exactly (e.g. YAML
+        allows non-string keys and dates), so every startup sees the same types.
+        The mirror is an optimisation only, so write failures are ignored.
+        """
+        try:
+            serialized = json.dumps(config, ensure_ascii=False)
+            if json.loads(serialized) != config:
+                return
+            fd, tmp_path = tempfile.mkstemp(
+                dir=os.path.dirname(json_path), suffix=".tmp"
+            )
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    f.write(serialized)
+                os.replace(tmp_path, json_path)
+            except Exception:
+                os.remove(tmp_path)
+                raise
+        except Exception:
+            pass
     
-    @property
+    @cached_property
     def api_base_url(self) -> str:
         """Get the API base URL."""
         return self._config.get('api', {}).get('base_url', '')
     
-    @property
+    @cached_property
     def max_concurrent_jobs(self) -> int:
         """Get maximum concurrent active jobs per user (request + from-layer)."""
         return self._config.get('api', {}).get('max_concurrent_jobs', 5)
 
-    @property
-    def api_endpoints(self) -> Dict[str, str]:
-        """Get API endpoints."""
-        return self._config.get('api', {}).get('endpoints', {})
+    @cached_property
+    def api_request_timeout_seconds(self) -> int:
+        """Get timeout in seconds for background API requests."""
+        return self._config.get('api', {}).get('request_timeout_seconds', 30)
+
+    @cached_property
+    def api_endpoints(self) -> Mapping[str, str]:
+        """Get read-only API endpoints."""
+        return MappingProxyType(self._config.get('api', {}).get('endpoints', {}))
     
-    @property
+    @cached_property
     def token_lifetime_minutes(self) -> int:
         """Get token lifetime in minutes."""
         return self._config.get('token', {}).get('lifetime_minutes', 6000)
     
-    @property
+    @cached_property
     def token_validation_interval_ms(self) -> int:
         """Get token validation interval in milliseconds."""
         return self._config.get('token', {}).get('validation_interval_ms', 60000)
     
-    @property
+    @cached_property
     def token_expiration_buffer_minutes(self) -> int:
         """Get token expiration buffer time in minutes."""
         return self._config.get('token', {}).get('expiration_buffer_minutes', 5)
     
-    @property
+    @cached_property
+    def token_refresh_ratio(self) -> float:
+        """Get the fraction of the token lifetime after which it is refreshed."""
+        return self._config.get('token', {}).get('refresh_ratio', 0.8)
+    
+    @cached_property
     def token_api_validation_timeout(self) -> int:
         """Get API validation timeout in seconds."""
         return self._config.get('token', {}).get('api_validation_timeout', 10)
     
-    @property
+    @cached_property
     def polling_interval_seconds(self) -> int:
         """Get polling interval in seconds."""
         return self._config.get('polling', {}).get('interval_seconds', 1)
     
-    @property
+    @cached_property
+    def polling_max_interval_seconds(self) -> float:
+        """Get the maximum job status poll delay in seconds."""
+        return self._config.get('polling', {}).get('max_interval_seconds', 30)
+    
+    @cached_property
+    def polling_backoff_factor(self) -> float:
+        """Get the growth factor of the job status poll delay."""
+        return self._config.get('polling', {}).get('backoff_factor', 1.5)
+    
+    @cached_property
+    def polling_jitter_ratio(self) -> float:
+        """Get the random jitter added to each poll delay, as a fraction of it."""
+        return self._config.get('polling', {}).get('jitter_ratio', 0.2)
+    
+    @cached_property
     def polling_error_sleep_seconds(self) -> int:
         """Get error sleep time in seconds."""
         return self._config.get('polling', {}).get('error_sleep_seconds', 5)
     
-    @property
-    def pipelines(self) -> list:
-        """Get pipeline definitions."""
-        return self._config.get('pipelines', [])
+    @cached_property
+    def pipelines(self) -> Tuple[Mapping[str, str], ...]:
+        """Get read-only pipeline definitions."""
+        return tuple(MappingProxyType(p) for p in self._config.get('pipelines', []))
     
-    def get_pipeline_info(self) -> Dict[str, Dict[str, str]]:
+    def _build_pipeline_tables(self):
+        """
+        Build the pipeline info and pipeline map tables in a single pass.
+        Returns a tuple (pipeline_info, pipeline_map).
+        """
+        pipeline_info = {}
+        pipeline_map = {}
+        for p in self.pipelines:
+            pipeline_info[p['name']] = MappingProxyType({
+                'pipeline': p['pipeline'],
+                'description': p['description'],
+                'image': p['image']
+            })
+            pipeline_map[p['name']] = p['pipeline']
+        return MappingProxyType(pipeline_info), MappingProxyType(pipeline_map)
+
+    @cached_property
+    def _pipeline_tables(self):
+        """Get the (pipeline_info, pipeline_map) tables, built once."""
+        return self._build_pipeline_tables()
+
+    @cached_property
+    def pipeline_info(self) -> Mapping[str, Mapping[str, str]]:
         """
-        Get pipeline information as a dictionary keyed by pipeline name.
+        Get read-only pipeline information keyed by pipeline name.
         Returns format: {name: {pipeline, description, image}}
         """
-        pipelines = self.pipelines
-        return {p['name']: {
-            'pipeline': p['pipeline'],
-            'description': p['description'],
-            'image': p['image']
-        } for p in pipelines}
-    
-    def get_pipeline_map(self) -> Dict[str, str]:
+        return self._pipeline_tables[0]
+
+    @cached_property
+    def pipeline_map(self) -> Mapping[str, str]:
         """
-        Get pipeline map for backward compatibility.
+        Get read-only pipeline map.
         Returns format: {name: pipeline_id}
         """
-        pipeline_info = self.get_pipeline_info()
-        return {k: v['pipeline'] for k, v in pipeline_info.items()}
+        return self._pipeline_tables[1]
+
+    def get_pipeline_info(self) -> Mapping[str, Mapping[str, str]]:
+        """Get pipeline information (see ``pipeline_info``)."""
+        return self.pipeline_info
+
+    def get_pipeline_map(self) -> Mapping[str, str]:
+        """Get pipeline map for backward compatibility (see ``pipeline_map``)."""
+        return self.pipeline_map
     
-    @property
-    def image_type_map(self) -> Dict[str, str]:
-        """Get image type mapping."""
-        return self._config.get('image_types', {})
+    @cached_property
+    def image_type_map(self) -> Mapping[str, str]:
+        """Get read-only image type mapping."""
+        return MappingProxyType(self._config.get('image_types', {}))
     
-    @property
+    @cached_property
     def style_root(self) -> str:
         """Get style root directory."""
         return self._config.get('styles', {}).get('root_directory', 'styles')
     
-    @property
-    def style_map(self) -> Dict[str, str]:
-        """Get style mapping."""
-        return self._config.get('styles', {}).get('mappings', {})
+    @cached_property
+    def style_map(self) -> Mapping[str, str]:
+        """Get read-only style mapping."""
+        return MappingProxyType(self._config.get('styles', {}).get('mappings', {}))
     
-    @property
+    @cached_property
     def credentials_file(self) -> str:
         """Get credentials file name."""
         return self._config.get('paths', {}).get('credentials_file', '.credentials')
     
-    @property
+    @cached_property
     def images_directory(self) -> str:
         """Get images directory path."""
         return self._config.get('paths', {}).get('images_directory', 'images')
     
-    @property
+    @cached_property
     def default_tab_index(self) -> int:
         """Get default tab index."""
         return self._config.get('ui', {}).get('default_tab_index', 0)
     
-    @property
-    def tab_states(self) -> list:
-        """Get tab enabled states."""
-        return self._config.get('ui', {}).get('tab_states', [])
+    @cached_property
+    def tab_states(self) -> Tuple[Mapping[str, Any], ...]:
+        """Get read-only tab enabled states."""
+        return tuple(MappingProxyType(t) for t in self._config.get('ui', {}).get('tab_states', []))
     
-    @property
+    @cached_property
     def processing_chunk_size(self) -> int:
         """Get processing chunk size."""
-        return self._config.get('processing', {}).get('chunk_size', 8192)
+        return self._config.get('processing', {}).get('chunk_size', 1048576)
     
-    @property
+    @cached_property
     def temp_dir_prefix(self) -> str:
         """Get temporary directory prefix."""
         return self._config.get('processing', {}).get('temp_dir_prefix', 'qgis_ermes_')
     
-    @property
+    @cached_property
     def cache_dir_name(self) -> str:
         """Get cache directory name."""
         return self._config.get('processing', {}).get('cache_dir_name', 'ermes_qgis')
@@ -2,9 +2,11 @@
 """
 Date utility functions for parsing and formatting dates.
 """
-from datetime import datetime
+from datetime import date as _date, datetime
+from functools import lru_cache
 
 
+@lru_cache(maxsize=1024)
 def parse_date(date: str) -> str:
     """If a date string is set it parses it into a format YYYY-MM-DD. In case parsing fails None is returned.
 
@@ -14,7 +16,10 @@ def parse_date(date: str) -> str:
     if date == "":
         return date
     try:
-        return datetime.fromisoformat(date).isoformat()
+        if len(date) == 10:
+            # Plain YYYY-MM-DD: validate without building a datetime
+            return _date.fromisoformat(date).isoformat()
+        return datetime.fromisoformat(date).date().isoformat()
     except ValueError:
         return None
 
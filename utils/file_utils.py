@@ -0,0 +1,26 @@
+# -*- coding: utf-8 -*-
+"""
+File utility functions for writing downloaded results to disk.
+"""
+import os
+
+# Buffer size for writing large downloads (fewer write() syscalls than the 8 KiB default)
+WRITE_BUFFER_SIZE = 1 << 20
+
+
+def preallocate(file_obj, headers):
+    """Reserve disk space for a download whose size is known from its response headers.
+
+    Avoids repeatedly extending the file during the write loop. Skipped when the body is
+    content-encoded (Content-Length is then the compressed size) or posix_fallocate is unavailable.
+
+    :param file_obj: A binary file object opened for writing, positioned at its start
+    :param headers: The response headers of the download
+    """
+    length = headers.get("Content-Length")
+    if not length or headers.get("Content-Encoding") or not hasattr(os, "posix_fallocate"):
+        return
+    try:
+        os.posix_fallocate(file_obj.fileno(), 0, int(length))
+    except (OSError, ValueError):
+        pass
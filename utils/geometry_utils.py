@@ -12,6 +12,60 @@ from qgis.core import (
 )
 
 
+# Number of geometries unioned together per batch in unify_layer_geometries
+_UNION_CHUNK_SIZE = 512
+
+# Shared EPSG:4326 CRS, created on first use (see get_epsg4326_crs)
+_EPSG_4326_CRS = None
+
+# Transforms to EPSG:4326 keyed by source CRS authid (see create_transform_to_epsg4326).
+# Built with the project's transform context, so they are dropped whenever it changes.
+_TRANSFORMS_TO_EPSG_4326 = {}
+_TRANSFORM_CACHE_CONNECTED = False
+
+
+def _clear_transform_cache():
+    """Drop cached transforms (connected to QgsProject.transformContextChanged)."""
+    _TRANSFORMS_TO_EPSG_4326.clear()
+
+
+def get_epsg4326_crs():
+    """
+    Get the shared EPSG:4326 CRS instance.
+
+    :return: QgsCoordinateReferenceSystem for EPSG:4326
+    """
+    global _EPSG_4326_CRS
+    if _EPSG_4326_CRS is None:
+        _EPSG_4326_CRS = QgsCoordinateReferenceSystem("EPSG:4326")
+    return _EPSG_4326_CRS
+
+
+def create_transform_to_epsg4326(source_crs):
+    """
+    Get a coordinate transform from a CRS to EPSG:4326.
+    Transforms are reused per source authid until the project's transform context
+    changes (e.g. datum transform settings or a newly loaded project); CRSs without
+    an authid are not cached.
+
+    :param source_crs: Source CRS
+    :return: QgsCoordinateTransform from source_crs to EPSG:4326
+    """
+    global _TRANSFORM_CACHE_CONNECTED
+    project = QgsProject.instance()
+    if not _TRANSFORM_CACHE_CONNECTED:
+        project.transformContextChanged.connect(_clear_transform_cache)
+        _TRANSFORM_CACHE_CONNECTED = True
+
+    authid = source_crs.authid()
+    transform = _TRANSFORMS_TO_EPSG_4326.get(authid) if authid else None
+    if transform is None:
+        transform = QgsCoordinateTransform(source_crs, get_epsg4326_crs(), project)
+        if authid:
+            _TRANSFORMS_TO_EPSG_4326[authid] = transform
+    return transform
+
+
 def transform_geometry_to_epsg4326(geometry, source_crs):
     """
     Transform a geometry to EPSG:4326 if needed.
@@ -20,15 +74,12 @@ def transform_geometry_to_epsg4326(geometry, source_crs):
     :param source_crs: Source CRS of the geometry
     :return: Tuple (transformed_geometry, was_transformed, error_message)
     """
-    target_crs = QgsCoordinateReferenceSystem("EPSG:4326")
-    
-    if source_crs == target_crs:
+    # Cheap authid check first, full CRS comparison only as a fallback
+    if source_crs.authid() == "EPSG:4326" or source_crs == get_epsg4326_crs():
         return geometry, False, None
     
     try:
-        transform = QgsCoordinateTransform(
-            source_crs, target_crs, QgsProject.instance()
-        )
+        transform = create_transform_to_epsg4326(source_crs)
         geometry.transform(transform)
         return geometry, True, None
     except Exception as e:
@@ -56,12 +107,24 @@ def unify_layer_geometries(layer):
     :param layer: QgsVectorLayer to process
     :return: Tuple (unified_geometry, error_message)
     """
-    all_geoms = [feature.geometry() for feature in layer.getFeatures()]
+    # Union in fixed-size batches, then union the partial results, so the
+    # geometries of the whole layer are never held in memory at once
+    partials = []
+    chunk = []
+    for feature in layer.getFeatures():
+        chunk.append(feature.geometry())
+        if len(chunk) >= _UNION_CHUNK_SIZE:
+            partials.append(QgsGeometry.unaryUnion(chunk))
+            chunk = []
+    if chunk:
+        partials.append(QgsGeometry.unaryUnion(chunk))
     
-    if not all_geoms:
+    if not partials:
         return None, "The selected layer has no features."
     
-    unified_geom = QgsGeometry.unaryUnion(all_geoms)
+    unified_geom = (
+        partials[0] if len(partials) == 1 else QgsGeometry.unaryUnion(partials)
+    )
     
     if unified_geom.isEmpty():
         return None, "Could not create a valid geometry from the layer."
@@ -77,4 +140,3 @@ def geometry_to_json(geometry):
     :return: JSON string representation of the geometry
     """
     return geometry.asJson()
-
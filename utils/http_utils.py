@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+"""
+HTTP utility functions for the ERMES QGIS plugin.
+Provides pooled, keep-alive sessions for talking to the ERMES API
+and helpers for decoding its responses.
+"""
+import os
+from email.message import Message
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def create_session():
+    """
+    Create a requests.Session that reuses connections to the API.
+
+    Idempotent requests are retried on transient gateway errors (502/503/504);
+    POST requests are never retried. After the last retry the response is
+    returned as-is, so callers still get an HTTPError from raise_for_status.
+
+    Accept-Encoding advertises every codec urllib3 can decode here, so zstd
+    and brotli are negotiated when zstandard/brotli are installed.
+
+    :return: A configured requests.Session
+    """
+    session = requests.Session()
+    session.headers["Accept-Encoding"] = ACCEPT_ENCODING
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=8,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=[502, 503, 504],
+            raise_on_status=False,
+        ),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def parse_json(response):
+    """
+    Decode a JSON response body, using orjson when it is installed.
+
+    :param response: A requests.Response with a JSON body
+    :return: The decoded JSON value
+    :raises requests.exceptions.JSONDecodeError: If the body is not valid JSON, as response.json() does
+    """
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.loads(response.content)
+        except orjson.JSONDecodeError as e:
+            raise requests.exceptions.JSONDecodeError(
+                e.msg, e.doc, e.pos, response=response
+            ) from e
+    return response.json()
+
+
+def filename_from_response(response, default):
+    """
+    Get a safe local filename from the Content-Disposition header of a response.
+
+    Handles quoted and RFC 5987 (filename*=UTF-8'') values and strips any directory
+    components, so the server cannot direct the write outside the target directory.
+
+    :param response: A requests.Response
+    :param default: The filename to use when the header is missing or unusable
+    :return: A bare filename
+    """
+    content_disp = response.headers.get("Content-Disposition")
+    if not content_disp:
+        return default
+    message = Message()
+    message["Content-Disposition"] = content_disp
+    filename = os.path.basename((message.get_filename() or "").replace("\\", "/"))
+    if filename in ("", ".", ".."):
+        return default
+    return filename
@@ -5,8 +5,6 @@ from qgis.core import (
     QgsWkbTypes,
     QgsRectangle,
     QgsPointXY,
-    QgsCoordinateTransform,
-    QgsCoordinateReferenceSystem,
     QgsProject,
     QgsVectorLayer,
     QgsFeature,
@@ -14,6 +12,7 @@ from qgis.core import (
     QgsFillSymbol,
     QgsSingleSymbolRenderer,
 )
+from ..utils.geometry_utils import create_transform_to_epsg4326
 
 
 class RectangleMapTool(QgsMapToolEmitPoint):
@@ -98,20 +97,13 @@ class RectangleMapTool(QgsMapToolEmitPoint):
         self.update_bbox_from_geom(geom)
 
     def showRect(self, startPoint, endPoint):
-        self.rubberBand.reset(QgsWkbTypes.PolygonGeometry)
         if startPoint.x() == endPoint.x() or startPoint.y() == endPoint.y():
+            self.rubberBand.reset(QgsWkbTypes.PolygonGeometry)
             return
 
-        points = [
-            QgsPointXY(startPoint.x(), startPoint.y()),
-            QgsPointXY(startPoint.x(), endPoint.y()),
-            QgsPointXY(endPoint.x(), endPoint.y()),
-            QgsPointXY(endPoint.x(), startPoint.y()),
-            QgsPointXY(startPoint.x(), startPoint.y()),
-        ]
-
-        for i, p in enumerate(points):
-            self.rubberBand.addPoint(p, i == len(points) - 1)
+        self.rubberBand.setToGeometry(
+            QgsGeometry.fromRect(QgsRectangle(startPoint, endPoint)), None
+        )
         self.rubberBand.show()
 
     def rectangle(self):
@@ -149,10 +141,7 @@ class RectangleMapTool(QgsMapToolEmitPoint):
             print("ikke valid bounding box")
             return
         rect = geom.boundingBox()
-
-        crs_src = self.aoi_layer.crs()
-        crs_dst = QgsCoordinateReferenceSystem("EPSG:4326")
-        xform = QgsCoordinateTransform(crs_src, crs_dst, QgsProject.instance())
+        xform = create_transform_to_epsg4326(self.aoi_layer.crs())
 
         bottom_left = xform.transform(QgsPointXY(rect.xMinimum(), rect.yMinimum()))
         top_right = xform.transform(QgsPointXY(rect.xMaximum(), rect.yMaximum()))
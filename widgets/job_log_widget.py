@@ -7,8 +7,8 @@ from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QLabel, QPushButton, QFrame, QHBoxLayout,
     QProgressBar, QPlainTextEdit, QDialog, QDialogButtonBox, QTextEdit,
 )
-from PyQt5.QtCore import Qt
-from PyQt5.QtGui import QFontMetrics
+from PyQt5.QtCore import Qt, QTimer
+from PyQt5.QtGui import QFontMetrics, QTextCursor
 
 
 # Progress band while running: reserve 100 for terminal state.
@@ -17,6 +17,86 @@ _PROGRESS_MIN = 10
 _PROGRESS_MAX_RUNNING = 95
 _PROGRESS_WRAP = 30
 
+# Boxes pinned above the job rows, in layout order, and their slot index.
+_PINNED_BOX_ORDER = ("error", "warning")
+_PINNED_BOX_SLOTS = {box_type: i for i, box_type in enumerate(_PINNED_BOX_ORDER)}
+
+# Stylesheets shared by every JobRowWidget / BaseMessageBox instance.
+# Color-dependent ones are str.format templates.
+_ROW_LOGS_BUTTON_CSS = """
+    QPushButton { border: none; background: transparent; font-size: 14px; min-width: 22px; max-width: 22px; }
+    QPushButton:hover { background: #E0E0E0; border-radius: 3px; }
+"""
+_ROW_CLOSE_BUTTON_CSS = """
+    QPushButton { border: none; background: transparent; font-size: 14px; min-width: 22px; max-width: 22px; }
+    QPushButton:hover { color: #D32F2F; }
+"""
+_ROW_PROGRESS_CSS = """
+    QProgressBar { border: 1px solid #CCC; border-radius: 2px; text-align: center; }
+    QProgressBar::chunk { background: #2196F3; }
+"""
+_ROW_PROGRESS_SUCCESS_CSS = """
+    QProgressBar { border: 1px solid #CCC; border-radius: 2px; }
+    QProgressBar::chunk { background: #4CAF50; }
+"""
+_ROW_PROGRESS_ERROR_CSS = """
+    QProgressBar { border: 1px solid #CCC; border-radius: 2px; }
+    QProgressBar::chunk { background: #F44336; }
+"""
+_ROW_STATUS_CSS = (
+    "font-size: 9px; font-weight: bold; padding: 2px 6px; border-radius: 3px; color: {color};"
+)
+
+_BOX_HEADER_CSS = """
+    QFrame {{
+        background-color: {color};
+        border: 2px solid #CCCCCC;;
+        border-radius: 4px;
+        padding: 5px;
+    }}
+"""
+_BOX_EXPAND_BUTTON_CSS = """
+    QPushButton {
+        border: none;
+        background-color: transparent;
+        color: black;
+        font-size: 12px;
+        min-width: 20px;
+        max-width: 20px;
+    }
+"""
+_BOX_CLOSE_BUTTON_CSS = """
+    QPushButton {
+        border: none;
+        background-color: transparent;
+        color: black;
+        font-size: 16px;
+        font-weight: bold;
+        min-width: 20px;
+        max-width: 20px;
+    }
+    QPushButton:hover {
+        color: #D32F2F;
+    }
+"""
+_BOX_CONTENT_FRAME_CSS = """
+    QFrame {
+        background-color: white;
+        border: 1px solid #CCCCCC;
+        border-top: none;
+    }
+"""
+_BOX_MESSAGE_TEXT_CSS = """
+    QTextEdit {
+        border: 1px solid #DDDDDD;
+        border-radius: 3px;
+        background-color: #FAFAFA;
+        font-family: 'Courier New', monospace;
+        font-size: 14px;
+    }
+"""
+_BOX_STATUS_CSS = "color: {color}; font-size: 10px;"
+
 
 class JobRowWidget(QFrame):
     """Compact single row per job: title, last message, status pill, progress bar, + and X buttons."""
@@ -26,6 +106,7 @@ class JobRowWidget(QFrame):
         self.box_type = box_type
         self.title_text = title
         self.messages = []  # list of (message, level) for full log dialog
+        self._msg_keys = set()  # same pairs as self.messages, for O(1) duplicate checks
         self._progress_value = _PROGRESS_MIN
         self._expected_messages = None
         self._completed_messages = 0
@@ -64,19 +145,13 @@ class JobRowWidget(QFrame):
 
         self.logs_button = QPushButton("+")
         self.logs_button.setToolTip("Show full logs")
-        self.logs_button.setStyleSheet("""
-            QPushButton { border: none; background: transparent; font-size: 14px; min-width: 22px; max-width: 22px; }
-            QPushButton:hover { background: #E0E0E0; border-radius: 3px; }
-        """)
+        self.logs_button.setStyleSheet(_ROW_LOGS_BUTTON_CSS)
         self.logs_button.clicked.connect(self.open_logs_dialog)
         row.addWidget(self.logs_button)
 
         self.close_button = QPushButton("\u2715")
         self.close_button.setToolTip("Remove this job row")
-        self.close_button.setStyleSheet("""
-            QPushButton { border: none; background: transparent; font-size: 14px; min-width: 22px; max-width: 22px; }
-            QPushButton:hover { color: #D32F2F; }
-        """)
+        self.close_button.setStyleSheet(_ROW_CLOSE_BUTTON_CSS)
         row.addWidget(self.close_button)
 
         layout.addLayout(row)
@@ -86,19 +161,18 @@ class JobRowWidget(QFrame):
         self.progress_bar.setValue(self._progress_value)
         self.progress_bar.setMinimumHeight(6)
         self.progress_bar.setMaximumHeight(8)
-        self.progress_bar.setStyleSheet("""
-            QProgressBar { border: 1px solid #CCC; border-radius: 2px; text-align: center; }
-            QProgressBar::chunk { background: #2196F3; }
-        """)
+        self.progress_bar.setStyleSheet(_ROW_PROGRESS_CSS)
         layout.addWidget(self.progress_bar)
 
         self.setFrameStyle(QFrame.StyledPanel)
         self.setStyleSheet("JobRowWidget, QFrame { background-color: #F5F5F5; border: 1px solid #DDD; border-radius: 3px; }")
 
     def add_message(self, message, level="info", display_message=None):
-        if (message, level) in self.messages:
+        key = (message, level)
+        if key in self._msg_keys:
             return
-        self.messages.append((message, level))
+        self._msg_keys.add(key)
+        self.messages.append(key)
         text_for_preview = (display_message if display_message is not None else message)
         formatted = f"[{level.upper()}] {text_for_preview}"
         self.last_message_label.setText(self._elide(formatted))
@@ -171,22 +245,14 @@ class JobRowWidget(QFrame):
 
     def set_status(self, status_text, color="black"):
         self.status_label.setText(status_text)
-        self.status_label.setStyleSheet(
-            f"font-size: 9px; font-weight: bold; padding: 2px 6px; border-radius: 3px; color: {color};"
-        )
+        self.status_label.setStyleSheet(_ROW_STATUS_CSS.format(color=color))
         if status_text.upper() in ("SUCCESS", "ERROR"):
             self._finished = True
             self.progress_bar.setValue(100)
             if status_text.upper() == "SUCCESS":
-                self.progress_bar.setStyleSheet("""
-                    QProgressBar { border: 1px solid #CCC; border-radius: 2px; }
-                    QProgressBar::chunk { background: #4CAF50; }
-                """)
+                self.progress_bar.setStyleSheet(_ROW_PROGRESS_SUCCESS_CSS)
             else:
-                self.progress_bar.setStyleSheet("""
-                    QProgressBar { border: 1px solid #CCC; border-radius: 2px; }
-                    QProgressBar::chunk { background: #F44336; }
-                """)
+                self.progress_bar.setStyleSheet(_ROW_PROGRESS_ERROR_CSS)
 
     def open_logs_dialog(self):
         d = QDialog(self.window())
@@ -214,6 +280,7 @@ class BaseMessageBox(QWidget):
         self.is_expanded = is_expanded
         self.prefix = prefix
         self.messages = []
+        self._msg_keys = set()  # same pairs as self.messages, for O(1) duplicate checks
         self.setup_ui()
     
     def setup_ui(self):
@@ -224,14 +291,7 @@ class BaseMessageBox(QWidget):
         # Header frame with title and expand/collapse button
         header_frame = QFrame()
         header_frame.setFrameShape(QFrame.Box)
-        header_frame.setStyleSheet(f"""
-            QFrame {{
-                background-color: {self.color};
-                border: 2px solid #CCCCCC;;
-                border-radius: 4px;
-                padding: 5px;
-            }}
-        """)
+        header_frame.setStyleSheet(_BOX_HEADER_CSS.format(color=self.color))
         
         header_layout = QHBoxLayout()
         header_layout.setContentsMargins(5, 5, 5, 5)
@@ -239,16 +299,7 @@ class BaseMessageBox(QWidget):
         # Expand/Collapse button
         self.expand_button = QPushButton()
         self.expand_button.setText("▼")
-        self.expand_button.setStyleSheet("""
-            QPushButton {
-                border: none;
-                background-color: transparent;
-                color: black;
-                font-size: 12px;
-                min-width: 20px;
-                max-width: 20px;
-            }
-        """)
+        self.expand_button.setStyleSheet(_BOX_EXPAND_BUTTON_CSS)
 
         self.expand_button.clicked.connect(self.toggle_expand)
         header_layout.addWidget(self.expand_button)
@@ -272,20 +323,7 @@ class BaseMessageBox(QWidget):
 
         # Close button
         self.close_button = QPushButton("✕")
-        self.close_button.setStyleSheet("""
-            QPushButton {
-                border: none;
-                background-color: transparent;
-                color: black;
-                font-size: 16px;
-                font-weight: bold;
-                min-width: 20px;
-                max-width: 20px;
-            }
-            QPushButton:hover {
-                color: #D32F2F;
-            }
-        """)
+        self.close_button.setStyleSheet(_BOX_CLOSE_BUTTON_CSS)
         self.close_button.setToolTip("Remove this message box")
         header_layout.addWidget(self.close_button)
 
@@ -295,13 +333,7 @@ class BaseMessageBox(QWidget):
         # Content area (initially visible)
         self.content_frame = QFrame()
         self.content_frame.setFrameShape(QFrame.StyledPanel)
-        self.content_frame.setStyleSheet("""
-            QFrame {
-                background-color: white;
-                border: 1px solid #CCCCCC;
-                border-top: none;
-            }
-        """)
+        self.content_frame.setStyleSheet(_BOX_CONTENT_FRAME_CSS)
 
         content_layout = QVBoxLayout()
         content_layout.setContentsMargins(10, 10, 10, 10)
@@ -311,15 +343,7 @@ class BaseMessageBox(QWidget):
         self.message_text.setReadOnly(True)
         self.message_text.setMinimumHeight(100)
         self.message_text.setMaximumHeight(200)
-        self.message_text.setStyleSheet("""
-            QTextEdit {
-                border: 1px solid #DDDDDD;
-                border-radius: 3px;
-                background-color: #FAFAFA;
-                font-family: 'Courier New', monospace;
-                font-size: 14px;
-            }
-        """)
+        self.message_text.setStyleSheet(_BOX_MESSAGE_TEXT_CSS)
         content_layout.addWidget(self.message_text)
 
         self.content_frame.setLayout(content_layout)
@@ -340,24 +364,43 @@ class BaseMessageBox(QWidget):
     
     def add_message(self, message, level="info"):
         """Add a message to this box (avoids duplicates)"""
-        # Check if this exact message already exists
-        if (message, level) in self.messages:
-            return  # Skip duplicate message
-        
-        self.messages.append((message, level))
-        
+        self.add_messages([(message, level)])
+
+    def add_messages(self, items):
+        """Add several (message, level) pairs with a single text area update (avoids duplicates)"""
+        formatted = []
+        for message, level in items:
+            # Check if this exact message already exists
+            key = (message, level)
+            if key in self._msg_keys:
+                continue  # Skip duplicate message
+            self._msg_keys.add(key)
+            self.messages.append(key)
+            formatted.append(f"[{level.upper()}] {message}")
+
+        if not formatted:
+            return
+
         # Update message count
         count = len(self.messages)
         self.message_count_label.setText(f"{count} message{'s' if count != 1 else ''}")
-        
-        # Update the text area
-        formatted_message = f"[{level.upper()}] {message}"
-        self.message_text.append(formatted_message)
+
+        # Update the text area in one insertion instead of one append (and reflow) per message
+        text = "\n".join(formatted)
+        if not self.message_text.document().isEmpty():
+            text = "\n" + text
+        self.message_text.setUpdatesEnabled(False)
+        cursor = self.message_text.textCursor()
+        cursor.movePosition(QTextCursor.End)
+        cursor.insertText(text)
+        self.message_text.setUpdatesEnabled(True)
+        scroll_bar = self.message_text.verticalScrollBar()
+        scroll_bar.setValue(scroll_bar.maximum())
         
     def update_status(self, status_text, color="black"):
         """Update the status label"""
         self.status_label.setText(status_text)
-        self.status_label.setStyleSheet(f"color: {color}; font-size: 10px;")
+        self.status_label.setStyleSheet(_BOX_STATUS_CSS.format(color=color))
     
     def get_most_recent_status(self):
         """Get the most recent message status"""
@@ -372,6 +415,9 @@ class JobLogWidget(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.message_boxes = {}  # box_type -> BaseMessageBox or JobRowWidget
+        # Messages for BaseMessageBox rows, coalesced and flushed on the next event loop pass
+        self._pending_messages = {}  # box_type -> list of (message, level)
+        self._flush_scheduled = False
         self.setup_ui()
 
     def setup_ui(self):
@@ -420,18 +466,25 @@ class JobLogWidget(QWidget):
                     lambda checked, bt=box_type: self.remove_box(bt)
                 )
 
-            insert_pos = 0
-            if box_type == "error":
-                insert_pos = 0
-            elif box_type == "warning":
-                insert_pos = 1 if "error" in self.message_boxes else 0
-            else:
-                insert_pos = sum(1 for k in ["error", "warning"] if k in self.message_boxes)
+            # Pinned boxes keep their slot order at the top; job rows go right below them
+            slot = _PINNED_BOX_SLOTS.get(box_type, len(_PINNED_BOX_SLOTS))
+            insert_pos = sum(
+                1 for k in _PINNED_BOX_ORDER[:slot] if k in self.message_boxes
+            )
             self.container_layout.insertWidget(insert_pos, self.message_boxes[box_type])
             self.placeholder.setVisible(False)
         return self.message_boxes[box_type]
 
+    def _flush_pending_messages(self):
+        self._flush_scheduled = False
+        pending, self._pending_messages = self._pending_messages, {}
+        for box_type, items in pending.items():
+            box = self.message_boxes.get(box_type)
+            if isinstance(box, BaseMessageBox):
+                box.add_messages(items)
+
     def remove_box(self, box_type="warning"):
+        self._pending_messages.pop(box_type, None)
         if box_type in self.message_boxes:
             self.container_layout.removeWidget(self.message_boxes[box_type])
             self.message_boxes[box_type].deleteLater()
@@ -444,7 +497,10 @@ class JobLogWidget(QWidget):
         if isinstance(box, JobRowWidget):
             box.add_message(message, level, display_message=display_message)
         else:
-            box.add_message(message, level)
+            self._pending_messages.setdefault(box_type, []).append((message, level))
+            if not self._flush_scheduled:
+                self._flush_scheduled = True
+                QTimer.singleShot(0, self._flush_pending_messages)
 
     def set_expected_messages(self, box_type, total):
         box = self._get_or_create_box(box_type)
@@ -487,6 +543,7 @@ class JobLogWidget(QWidget):
                 w.toggle_expand()
 
     def clear_box(self, box_type):
+        self._pending_messages.pop(box_type, None)
         if box_type in self.message_boxes:
             self.container_layout.removeWidget(self.message_boxes[box_type])
             self.message_boxes[box_type].deleteLater()
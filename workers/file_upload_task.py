@@ -4,6 +4,17 @@ import tempfile
 from qgis.core import QgsTask
 from PyQt5.QtCore import pyqtSignal
 from .token_manager import TokenManager
+from ..utils.http_utils import create_session
+from ..utils.file_utils import WRITE_BUFFER_SIZE
+
+try:
+    from requests_toolbelt.multipart.encoder import (
+        MultipartEncoder,
+        MultipartEncoderMonitor,
+    )
+    TOOLBELT_AVAILABLE = True
+except ImportError:
+    TOOLBELT_AVAILABLE = False
 
 
 class FileUploadTask(QgsTask):
@@ -35,18 +46,41 @@ class FileUploadTask(QgsTask):
         self.config = config
         self.result_path = None
         self.error_message = None
+        self._last_phase = None
+        self._last_pct = -1
+        self._job_url = f"{api_base_url}{config.api_endpoints['jobs_create_from_file']}"
+
+        # Keep-alive session; the token manager sets its Authorization header
+        self.session = create_session()
 
         # Initialize token manager
-        self.token_manager = TokenManager(api_base_url, config)
+        self.token_manager = TokenManager(api_base_url, config, session=self.session)
         self.token_manager.set_token(access_token)
 
     def _authenticate(self):
-        """Returns authentication headers after checking token validity"""
+        """Checks token validity. Returns True if authenticated requests can be made"""
         # Check if token is still valid
         if not self.token_manager.check_and_handle_expiration():
             self.error_message = "Authentication token has expired. Please login again."
-            return None
-        return {"Authorization": f"Bearer {self.access_token}"}
+            return False
+        return True
+
+    def _set_progress(self, progress):
+        """Forwards progress to the task manager only when the integer percent changes"""
+        if progress != self._last_pct:
+            self._last_pct = progress
+            self.setProgress(progress)
+
+    def _emit_phase(self, phase, progress, message, level="info"):
+        """Sets progress and emits one status update per phase transition"""
+        self._set_progress(progress)
+        if phase != self._last_phase:
+            self._last_phase = phase
+            self.status_update.emit(message, level)
+
+    def _on_upload_progress(self, bytes_read, file_size):
+        """Maps uploaded bytes onto the 20-70% progress band"""
+        self._set_progress(20 + min(50, int(50 * bytes_read / max(file_size, 1))))
 
     def run(self):
         """
@@ -56,30 +90,20 @@ class FileUploadTask(QgsTask):
         try:
             filename = os.path.basename(self.file_path)
 
-            # Set progress and update status
-            self.setProgress(5)
-            self.status_update.emit(f"Preparing to upload {filename}...", "info")
-
             # Check if task was cancelled
             if self.isCanceled():
                 return False
 
-            # Get authentication headers
-            self.setProgress(10)
-            headers = self._authenticate()
-            if headers is None:
+            # Check authentication
+            if not self._authenticate():
                 return False  # Error already set
 
-            # Prepare the API endpoint and parameters
-            job_url = f"{self.api_base_url}{self.config.api_endpoints['jobs_create_from_file']}"
+            # Prepare the API parameters
             params = {
                 "datatype_id": self.datatype_id,
                 "image_type": self.image_type,
             }
 
-            self.setProgress(15)
-            self.status_update.emit(f"Uploading {filename} to server...", "info")
-
             # Check if task was cancelled
             if self.isCanceled():
                 return False
@@ -87,7 +111,6 @@ class FileUploadTask(QgsTask):
             # Get file size for progress tracking and validation
             file_size = os.path.getsize(self.file_path)
             file_size_mb = file_size / (1024 * 1024)
-            self.status_update.emit(f"File size: {file_size_mb:.1f} MB", "info")
 
             # Check file size limit (1 GB = 1024 MB)
             if file_size > 1024 * 1024 * 1024:  # 1 GB in bytes
@@ -98,25 +121,37 @@ class FileUploadTask(QgsTask):
 
             # Open the raster file for upload
             with open(self.file_path, "rb") as f:
-                files = {
+                fields = {
                     "file": (filename, f, "image/tiff"),
                 }
-
-                self.setProgress(20)
+                if TOOLBELT_AVAILABLE:
+                    # Stream the multipart body in constant memory and report upload progress
+                    monitor = MultipartEncoderMonitor(
+                        MultipartEncoder(fields=fields),
+                        lambda m: self._on_upload_progress(m.bytes_read, file_size),
+                    )
+                    body = {
+                        "data": monitor,
+                        "headers": {"Content-Type": monitor.content_type},
+                    }
+                else:
+                    body = {"files": fields}
 
                 # Make the request with timeout and progress tracking
                 try:
-                    self.status_update.emit(
-                        "Upload and inference in progress (this may take several minutes)...",
-                        "info",
+                    self._emit_phase(
+                        "uploading",
+                        20,
+                        f"Uploading {filename} ({file_size_mb:.1f} MB), upload and inference "
+                        "in progress (this may take several minutes)...",
                     )
 
-                    response = requests.post(
-                        job_url,
-                        headers=headers,
+                    response = self.session.post(
+                        self._job_url,
                         params=params,
-                        files=files,
                         timeout=6000,
+                        stream=True,
+                        **body,
                     )
                     response.raise_for_status()
 
@@ -146,11 +181,6 @@ class FileUploadTask(QgsTask):
                     )
                     return False
 
-            self.setProgress(70)
-            self.status_update.emit(
-                "Inference completed, processing response...", "info"
-            )
-
             # Check if task was cancelled
             if self.isCanceled():
                 return False
@@ -158,20 +188,32 @@ class FileUploadTask(QgsTask):
             # Check the response content type
             content_type = response.headers.get("Content-Type", "")
             if "image/tiff" in content_type or "image/tif" in content_type:
-                self.setProgress(85)
-                self.status_update.emit("Saving result TIFF file...", "info")
+                self._emit_phase(
+                    "saving", 85, "Inference completed, saving result TIFF file..."
+                )
 
-                # Save the response to a temporary file
-                temp_tiff = tempfile.NamedTemporaryFile(delete=False, suffix=".tif")
-                temp_tiff.write(response.content)
-                temp_tiff.close()
+                # Stream the response to a temporary file instead of buffering it in memory
+                canceled = False
+                fd, temp_path = tempfile.mkstemp(suffix=".tif")
+                with os.fdopen(fd, "wb", buffering=WRITE_BUFFER_SIZE) as temp_tiff:
+                    for chunk in response.iter_content(
+                        chunk_size=self.config.processing_chunk_size
+                    ):
+                        if self.isCanceled():
+                            canceled = True
+                            break
+                        temp_tiff.write(chunk)
+                if canceled:
+                    response.close()
+                    os.remove(temp_path)
+                    return False
 
-                self.result_path = temp_tiff.name
-                self.setProgress(100)
-                self.status_update.emit("Inference completed successfully!", "success")
+                self.result_path = temp_path
+                self._emit_phase(
+                    "done", 100, "Inference completed successfully!", "success"
+                )
 
-                # Manually emit the completion signal since finished() might not be called
-                self.upload_completed.emit(self.result_path, self.datatype_id)
+                # upload_completed is emitted from finished() on the main thread
                 return True
             else:
                 # If the API returns JSON (e.g., error), extract the message
@@ -200,6 +242,8 @@ class FileUploadTask(QgsTask):
         """
         Called when the task is finished. This runs in the main thread.
         """
+        # run() is done with the session by now
+        self.session.close()
 
         if result and self.result_path:
             # Success - emit signal to load the layer
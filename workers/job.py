@@ -1,7 +1,8 @@
-import time
+import threading
 import requests
 from PyQt5.QtCore import QObject, pyqtSignal
 from .token_manager import TokenManager
+from ..utils.http_utils import create_session, parse_json
 
 
 class JobsWorker(QObject):
@@ -18,30 +19,36 @@ class JobsWorker(QObject):
         self.access_token = access_token
         self.config = config
         self.is_running = True
-        self.token_manager = TokenManager(api_base_url, config)
+        self._jobs_url = f"{api_base_url}{config.api_endpoints['jobs_list']}"
+        self._stop_event = threading.Event()
+
+        # Keep-alive session shared with the token manager, which sets its Authorization header
+        self.session = create_session()
+
+        self.token_manager = TokenManager(api_base_url, config, session=self.session)
         self.token_manager.set_token(access_token)
 
     def _authenticate(self):
-        """Returns authentication headers after checking token validity"""
+        """Checks token validity. Returns True if authenticated requests can be made"""
         # Check if token is still valid
         if not self.token_manager.check_and_handle_expiration():
             # Token is expired, emit error signal
             self.error.emit("Authentication token has expired. Please login again.")
-            return None
-        return {"Authorization": f"Bearer {self.access_token}"}
+            return False
+        return True
 
     def _get_jobs(self):
         """Fetches all jobs for the current user"""
-        headers = self._authenticate()
-        if headers is None:
+        if not self._authenticate():
             return []  # Token expired, return empty list
 
-        jobs_url = f"{self.api_base_url}{self.config.api_endpoints['jobs_list']}"
-
-        response = requests.get(jobs_url, headers=headers)
+        # Bounded wait so a stalled connection cannot block the loop (and stop()) indefinitely
+        response = self.session.get(
+            self._jobs_url, timeout=self.config.api_request_timeout_seconds
+        )
         response.raise_for_status()
 
-        return response.json()["jobs"]
+        return parse_json(response)["jobs"]
 
     def run(self):
         """Main worker loop - fetches jobs every 30 seconds"""
@@ -55,17 +62,18 @@ class JobsWorker(QObject):
                 except Exception as e:
                     self.error.emit(f"Unexpected error: {e}")
 
-                # Wait 30 seconds before next fetch
-                for _ in range(30):
-                    if not self.is_running:
-                        break
-                    time.sleep(1)
+                # Wait 30 seconds before next fetch, waking up at once on stop()
+                if self._stop_event.wait(30.0):
+                    break
 
         except Exception as e:
             self.error.emit(f"Worker error: {e}")
         finally:
+            # Closed here rather than in stop(), which runs on another thread while a request may be in flight
+            self.session.close()
             self.finished.emit()
 
     def stop(self):
         """Stops the worker"""
         self.is_running = False
+        self._stop_event.set()
@@ -4,6 +4,8 @@ import tempfile
 from qgis.core import QgsTask
 from PyQt5.QtCore import pyqtSignal
 from .token_manager import TokenManager
+from ..utils.http_utils import create_session, filename_from_response
+from ..utils.file_utils import WRITE_BUFFER_SIZE, preallocate
 
 
 class JobDownloadTask(QgsTask):
@@ -14,6 +16,11 @@ class JobDownloadTask(QgsTask):
     download_completed = pyqtSignal(str, str)  # file_path, datatype_id
     download_failed = pyqtSignal(str)  # error message
 
+    # Download directory shared by all tasks of the session, created on first use
+    _download_dir = None
+    # Connection pool shared by all download tasks, created on first use
+    _session = None
+
     def __init__(
         self,
         description,
@@ -22,6 +29,7 @@ class JobDownloadTask(QgsTask):
         access_token,
         dialog_ref,
         config,
+        datatype_id=None,
     ):
         super().__init__(description, QgsTask.CanCancel)
         self.job_id = job_id
@@ -30,22 +38,54 @@ class JobDownloadTask(QgsTask):
         self.dialog_ref = dialog_ref
         self.config = config
         self.result_path = None
-        self.datatype_id = None
+        self.datatype_id = datatype_id
         self.error_message = None
         self.total_size = 0
         self.downloaded_size = 0
-
-        # Initialize token manager
-        self.token_manager = TokenManager(api_base_url, config)
+        self._last_phase = None
+        self._last_pct = -1
+
+        # Endpoint URLs are fixed for the task lifetime
+        endpoints = config.api_endpoints
+        self._job_url = f"{api_base_url}{endpoints['jobs_detail'].format(job_id=job_id)}"
+        self._retrieve_url = f"{api_base_url}{endpoints['retrieve'].format(job_id=job_id)}"
+
+        # Created here on the main thread so concurrent tasks never race on it
+        if JobDownloadTask._download_dir is None:
+            JobDownloadTask._download_dir = tempfile.mkdtemp(prefix=config.temp_dir_prefix)
+
+        # Shared keep-alive session so concurrent downloads reuse pooled connections;
+        # the token is sent per request because tasks may hold different tokens
+        if JobDownloadTask._session is None:
+            JobDownloadTask._session = create_session()
+        self.session = JobDownloadTask._session
+
+        # Initialize token manager; it must not put this task's token on the shared session
+        self.token_manager = TokenManager(
+            api_base_url, config, session=self.session, owns_session=False
+        )
         self.token_manager.set_token(access_token)
 
     def _authenticate(self):
-        """Returns authentication headers after checking token validity"""
+        """Checks token validity. Returns True if authenticated requests can be made"""
         # Check if token is still valid
         if not self.token_manager.check_and_handle_expiration():
             self.error_message = "Authentication token has expired. Please login again."
-            return None
-        return {"Authorization": f"Bearer {self.access_token}"}
+            return False
+        return True
+
+    def _set_progress(self, progress):
+        """Forwards progress to the task manager only when the integer percent changes"""
+        if progress != self._last_pct:
+            self._last_pct = progress
+            self.setProgress(progress)
+
+    def _emit_phase(self, phase, progress, message, level="info"):
+        """Sets progress and emits one status update per phase transition"""
+        self._set_progress(progress)
+        if phase != self._last_phase:
+            self._last_phase = phase
+            self.status_update.emit(message, level)
 
     def run(self):
         """
@@ -53,72 +93,60 @@ class JobDownloadTask(QgsTask):
         Returns True if successful, False if failed.
         """
         try:
-            # Set progress and update status
-            self.setProgress(1)
-            self.status_update.emit(f"Preparing to download job {self.job_id}...", "info")
-
             # Check if task was cancelled
             if self.isCanceled():
                 return False
 
-            # Get authentication headers
-            self.setProgress(5)
-            headers = self._authenticate()
-            if headers is None:
+            # Check authentication
+            if not self._authenticate():
                 return False  # Error already set
 
-            # First, get the job details to retrieve the datatype_id
-            self.setProgress(10)
-            self.status_update.emit(f"Fetching job details for {self.job_id}...", "info")
-            
-            job_url = f"{self.api_base_url}{self.config.api_endpoints['jobs_detail'].format(job_id=self.job_id)}"
-            
-            job_response = requests.get(job_url, headers=headers)
-            job_response.raise_for_status()
-            job_data = job_response.json()
+            self._emit_phase("downloading", 10, f"Downloading job {self.job_id}...")
 
-            # Extract datatype_id from the job data
-            self.datatype_id = job_data.get("body", {}).get("datatype_id", None)
+            # Fetch the job details only if the caller did not provide the datatype_id
+            if self.datatype_id is None:
+                job_response = self.session.get(
+                    self._job_url, headers=self.token_manager.auth_header
+                )
+                job_response.raise_for_status()
+                job_data = job_response.json()
+                self.datatype_id = job_data.get("body", {}).get("datatype_id", None)
 
             # Check if task was cancelled
             if self.isCanceled():
                 return False
 
-            # Get the retrieve URL
-            self.setProgress(15)
-            retrieve_url = f"{self.api_base_url}{self.config.api_endpoints['retrieve'].format(job_id=self.job_id)}"
-            self.status_update.emit(f"Starting download for job {self.job_id}...", "info")
+            self._set_progress(15)
 
             # Download the file
-            with requests.get(retrieve_url, headers=headers, stream=True) as response:
+            with self.session.get(
+                self._retrieve_url, headers=self.token_manager.auth_header, stream=True
+            ) as response:
                 response.raise_for_status()
 
                 # Get content length for progress tracking
                 self.total_size = int(response.headers.get('Content-Length', 0))
                 
                 # Get filename from Content-Disposition header
-                content_disp = response.headers.get("Content-Disposition", "")
-                filename = None
-                if "filename=" in content_disp:
-                    filename = content_disp.split("filename=")[-1].strip('"; ')
-                if not filename:
-                    filename = f"{self.job_id}.zip"
-
-                # Use a temporary directory to save the file
-                temp_dir = tempfile.mkdtemp(prefix=f"{self.config.temp_dir_prefix}{self.job_id}_")
-                cache_path = os.path.join(temp_dir, filename)
+                filename = filename_from_response(response, f"{self.job_id}.zip")
+
+                # A unique subdirectory per run so concurrent downloads (even of the same job)
+                # never share a file, while keeping the original filename for the layer name
+                run_dir = tempfile.mkdtemp(dir=self._download_dir, prefix=f"{self.job_id}_")
+                cache_path = os.path.join(run_dir, filename)
                 self.result_path = cache_path  # Store for cleanup later
 
                 # Download with progress tracking
                 self.downloaded_size = 0
                 chunk_size = self.config.processing_chunk_size
                 
-                with open(cache_path, "wb") as f:
+                with open(cache_path, "wb", buffering=WRITE_BUFFER_SIZE) as f:
+                    preallocate(f, response.headers)
                     for chunk in response.iter_content(chunk_size=chunk_size):
                         # Check if task was cancelled
                         if self.isCanceled():
                             os.remove(cache_path)
-                            os.rmdir(temp_dir)
+                            os.rmdir(run_dir)
                             return False
                         
                         if chunk:
@@ -129,14 +157,13 @@ class JobDownloadTask(QgsTask):
                             if self.total_size > 0:
                                 progress = int((self.downloaded_size / self.total_size) * 100)
                                 progress = max(20, min(95, progress))  # Keep progress between 20-95%
-                                self.setProgress(progress)
+                                self._set_progress(progress)
 
+            self._emit_phase(
+                "done", 100, f"Download completed for job {self.job_id}!", "success"
+            )
 
-            self.setProgress(100)
-            self.status_update.emit(f"Download completed for job {self.job_id}!", "success")
-
-            # Manually emit the completion signal
-            self.download_completed.emit(self.result_path, self.datatype_id)
+            # download_completed is emitted from finished() on the main thread
             return True
 
         except requests.exceptions.RequestException as e:
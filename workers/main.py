@@ -1,9 +1,13 @@
 import os
-import time
+import random
+import shutil
+import threading
 import tempfile
 import requests
 from PyQt5.QtCore import QObject, pyqtSignal
 from .token_manager import TokenManager
+from ..utils.http_utils import create_session, filename_from_response, parse_json
+from ..utils.file_utils import WRITE_BUFFER_SIZE, preallocate
 
 
 class MainWorker(QObject):
@@ -27,6 +31,9 @@ class MainWorker(QObject):
         password: str,
         job_id: int,
         config=None,
+        min_delay: float = None,
+        max_delay: float = None,
+        growth: float = None,
     ):
         super().__init__()
         self.api_base_url = api_base_url
@@ -36,38 +43,65 @@ class MainWorker(QObject):
         self.config = config
         self.access_token = None
         self.is_running = True
-        self.token_manager = TokenManager(api_base_url, config)
+        self._stop_event = threading.Event()
+        # Endpoint URLs are fixed for the worker lifetime
+        endpoints = config.api_endpoints
+        self._auth_url = f"{api_base_url}{endpoints['login']}"
+        self._status_url = f"{api_base_url}{endpoints['jobs_detail'].format(job_id=job_id)}"
+        self._retrieve_url = f"{api_base_url}{endpoints['retrieve'].format(job_id=job_id)}"
+        # Adaptive polling: delay grows by `growth` per unchanged poll, from min_delay up to max_delay.
+        # Defaults come from the polling section of the config.
+        self.min_delay = config.polling_interval_seconds if min_delay is None else min_delay
+        self.max_delay = config.polling_max_interval_seconds if max_delay is None else max_delay
+        self.growth = config.polling_backoff_factor if growth is None else growth
+        self.jitter_ratio = config.polling_jitter_ratio
+        self._delay = None
+        self._last_progress = None
+        # Conditional polling: ETag of the last status response and its decoded payload
+        self._status_etag = None
+        self._last_status_payload = None
+        # Per-job cache directory under the system temp dir, created once rather than per download
+        self._cache_dir = os.path.join(
+            tempfile.gettempdir(), config.cache_dir_name, str(job_id)
+        )
+        os.makedirs(self._cache_dir, exist_ok=True)
+        # Keep-alive session shared with the token manager, which sets its Authorization header at login
+        self.session = create_session()
+        # This worker logs in again on expiry, so it refreshes early at the configured ratio
+        self.token_manager = TokenManager(
+            api_base_url,
+            config,
+            session=self.session,
+            refresh_ratio=config.token_refresh_ratio,
+        )
 
     def _authenticate(self):
         """
         Authenticates with the API and gets an access token.
         Checks for token expiration before making requests.
+        The Authorization header is set on the worker session.
 
-        :returns: A dictionary containing the Authorization header with the Bearer token.
         :raises HTTPError: If the authentication request fails.
         """
         # Check if current token is still valid
         if self.access_token and self.token_manager.is_token_valid():
-            return {"Authorization": f"Bearer {self.access_token}"}
+            return
 
         # Token is expired or doesn't exist, get a new one
-        auth_url = f"{self.api_base_url}/auth/login"
         data = {
             "username": self.username,
             "password": self.password,
         }
 
-        response = requests.post(auth_url, data=data)
+        response = self.session.post(self._auth_url, data=data)
         response.raise_for_status()
 
         token_data = response.json()
         self.access_token = token_data["access_token"]
 
-        # Update token manager with new token
+        # Update token manager with new token (also authorizes the session)
         self.token_manager.set_token(self.access_token)
 
-        return {"Authorization": f"Bearer {self.access_token}"}
-
     def _get_job_status(self):
         """
         Gets the current status of the job.
@@ -75,13 +109,35 @@ class MainWorker(QObject):
         :returns: The job status response as a dictionary.
         :raises HTTPError: If the request fails.
         """
-        headers = self._authenticate()
-        status_url = f"{self.api_base_url}/jobs/{self.job_id}"
+        self._authenticate()
 
-        response = requests.get(status_url, headers=headers)
+        headers = {"If-None-Match": self._status_etag} if self._status_etag else None
+        response = self.session.get(self._status_url, headers=headers)
+        if response.status_code == 401:
+            # Token rejected before its local expiry: log in again and retry once
+            self.token_manager.clear_token()
+            self._authenticate()
+            response = self.session.get(self._status_url, headers=headers)
+        if response.status_code == 304:
+            # Unchanged since the last poll: no body to transfer or parse
+            return self._last_status_payload
         response.raise_for_status()
 
-        return response.json()
+        self._status_etag = response.headers.get("ETag")
+        self._last_status_payload = parse_json(response)
+        return self._last_status_payload
+
+    def _next_delay(self):
+        """
+        Returns the delay before the next status poll.
+        Starts at min_delay and grows geometrically up to max_delay until reset,
+        plus a random jitter so workers started together do not poll in lockstep.
+        """
+        if self._delay is None:
+            self._delay = self.min_delay
+        else:
+            self._delay = min(self.max_delay, self._delay * self.growth)
+        return self._delay + random.uniform(0, self.jitter_ratio * self._delay)
 
     def _download_resource(self):
         """
@@ -91,35 +147,26 @@ class MainWorker(QObject):
         :return: The local cache path where the downloaded resource is saved.
         :raises HTTPError: If the HTTP request to the URL fails.
         """
-        retrieve_url = f"{self.api_base_url}/retrieve/{self.job_id}"
         self.status_updated.emit(
             f"Job {self.job_id} status: success - Request completed, downloading layer"
         )
-        headers = self._authenticate()
+        self._authenticate()
 
         # Make the request to the retrieve endpoint
-        with requests.get(retrieve_url, headers=headers, stream=True) as response:
+        with self.session.get(self._retrieve_url, stream=True) as response:
             response.raise_for_status()
             # Try to get filename from Content-Disposition header, else fallback to job_id.zip
-            content_disp = response.headers.get("Content-Disposition", "")
-            filename = None
-            if "filename=" in content_disp:
-                filename = content_disp.split("filename=")[-1].strip('"; ')
-            if not filename:
-                # fallback: try to get from URL or use job_id.zip
-                filename = f"{self.job_id}.zip"
-
-            # Use system temp directory to avoid permission issues
-            cache_dir = os.path.join(
-                tempfile.gettempdir(), "ermes_qgis", str(self.job_id)
-            )
-            os.makedirs(cache_dir, exist_ok=True)
-            cache_path = os.path.join(cache_dir, filename)
-
-            with open(cache_path, "wb") as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    if chunk:
-                        f.write(chunk)
+            filename = filename_from_response(response, f"{self.job_id}.zip")
+
+            cache_path = os.path.join(self._cache_dir, filename)
+
+            # Let urllib3 undo any Content-Encoding and copy in large C-level reads
+            response.raw.decode_content = True
+            with open(cache_path, "wb", buffering=WRITE_BUFFER_SIZE) as f:
+                preallocate(f, response.headers)
+                shutil.copyfileobj(
+                    response.raw, f, length=self.config.processing_chunk_size
+                )
 
         return cache_path
 
@@ -176,7 +223,8 @@ class MainWorker(QObject):
                             self.status_updated.emit(
                                 f"Job {self.job_id} Warning: {result}"
                             )
-                            time.sleep(5)
+                            if self._stop_event.wait(5):
+                                break
                         else:
                             self.error.emit(
                                 f"Job {self.job_id} Error: {status_code} - {result}"
@@ -185,11 +233,16 @@ class MainWorker(QObject):
                             self.log_separator.emit()
                             break
                     elif status in ["pending", "start", "update"]:
-                        # Job is still running, wait before checking again
-                        self.status_updated.emit(
-                            f"Job {self.job_id} status: {status} - {result} "
-                        )
-                        time.sleep(1)
+                        # Job is still running, wait before checking again.
+                        # Log and poll quickly again only after a change, back off while nothing happens
+                        if (status, result) != self._last_progress:
+                            self._last_progress = (status, result)
+                            self._delay = None
+                            self.status_updated.emit(
+                                f"Job {self.job_id} status: {status} - {result} "
+                            )
+                        if self._stop_event.wait(self._next_delay()):
+                            break
                     else:
                         self.error.emit(
                             f"Job {self.job_id} Unknown job status: {status}"
@@ -208,9 +261,12 @@ class MainWorker(QObject):
             self.error.emit(f"Worker Error: {e}")
             self.job_ended.emit(False)
         finally:
+            # Closed here rather than in stop(), which runs on another thread while a request may be in flight
+            self.session.close()
             self.finished.emit()
 
     def stop(self):
         """Stops the worker. Called when the plugin is closed."""
         self.status_updated.emit("Worker: Stopping...")
         self.is_running = False
+        self._stop_event.set()
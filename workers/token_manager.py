@@ -1,50 +1,123 @@
+import base64
+import json
+import math
+import time
 import requests
-from datetime import datetime, timedelta
+from datetime import timedelta
 from PyQt5.QtCore import QObject, pyqtSignal
 
+# JWT lifetimes below this are treated as clock skew or bad claims, not as real expiry
+MIN_PLAUSIBLE_JWT_LIFETIME_SECONDS = 60
+
+
+def _jwt_claim(access_token: str, name: str):
+    """
+    Decode a NumericDate claim of a JWT (without verifying it) as a Unix timestamp.
+    Returns None if the token is not a JWT or the claim is missing or not a finite JSON number.
+    """
+    try:
+        payload = access_token.split(".")[1]
+        claims = json.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+        value = claims[name]
+    except (AttributeError, IndexError, KeyError, TypeError, ValueError):
+        return None
+    # RFC 7519 NumericDate is a JSON number: reject strings, booleans, NaN and infinities
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return None
+    if not math.isfinite(value):
+        return None
+    return float(value)
+
+
+def jwt_expiry(access_token: str):
+    """
+    Decode the exp claim of a JWT (without verifying it) as a Unix timestamp.
+    Returns None if the token is not a JWT or has no valid exp claim.
+    """
+    return _jwt_claim(access_token, "exp")
+
 
 class TokenManager(QObject):
     """
     Manages token validation and expiration checking.
     Provides signals for token expiration events.
-    Uses token age tracking instead of JWT parsing.
+    Uses token age tracking; the lifetime comes from the JWT exp claim when present,
+    otherwise from the configured lifetime.
     """
 
     # Signals
     token_expired = pyqtSignal()  # Emitted when token is expired
     token_refresh_needed = pyqtSignal()  # Emitted when token needs refresh
 
-    def __init__(self, api_base_url: str, config):
+    def __init__(
+        self,
+        api_base_url: str,
+        config,
+        session=None,
+        owns_session: bool = True,
+        refresh_ratio: float = None,
+    ):
         super().__init__()
         self.api_base_url = api_base_url
         self.config = config
+        # Reuse the owning worker's keep-alive session for validation calls when given.
+        # Unless the session is shared with other token holders, set_token also authorizes it.
+        self.session = session if session is not None else requests
+        self._bind_session = session is not None and owns_session
         self.access_token = None
+        self.auth_header = None
         self.token_created_at = None
         
         # Get token lifetime from config
         self.token_lifetime_minutes = self.config.token_lifetime_minutes
         self.expiration_buffer_minutes = self.config.token_expiration_buffer_minutes
+        # Early refresh only makes sense for owners that can log in again; others use the full lifetime
+        self.token_refresh_ratio = refresh_ratio
         self.api_validation_timeout = self.config.token_api_validation_timeout
+        # Cleared on the first 405/501 to HEAD, so later checks go straight to a single GET
+        self._head_supported = True
 
     def set_token(self, access_token: str, lifetime_minutes: int = None):
-        """Set the access token and track its creation time"""
+        """Set the access token and track its creation time (monotonic clock, immune to wall-clock jumps)"""
         self.access_token = access_token
-        self.token_created_at = datetime.now()
-        if lifetime_minutes is not None:
-            self.token_lifetime_minutes = lifetime_minutes
+        self.auth_header = {"Authorization": f"Bearer {access_token}"}
+        if self._bind_session:
+            self.session.headers.update(self.auth_header)
+        self.token_created_at = time.monotonic()
+        if lifetime_minutes is None:
+            # The server's claims are authoritative. exp - iat compares two server times; only
+            # without iat is exp compared against the local wall clock, which may be skewed.
+            # An expired or implausibly short result falls back to the configured lifetime.
+            exp = jwt_expiry(access_token)
+            iat = _jwt_claim(access_token, "iat")
+            if exp is None:
+                remaining_seconds = 0.0
+            elif iat is not None:
+                remaining_seconds = exp - iat
+            else:
+                remaining_seconds = exp - time.time()
+            if remaining_seconds >= MIN_PLAUSIBLE_JWT_LIFETIME_SECONDS:
+                lifetime_minutes = remaining_seconds / 60.0
+            else:
+                lifetime_minutes = self.config.token_lifetime_minutes
+        self.token_lifetime_minutes = lifetime_minutes
 
     def is_token_expired(self) -> bool:
         """Check if the current token is expired based on age"""
-        if not self.access_token or not self.token_created_at:
+        if not self.access_token or self.token_created_at is None:
             return True
 
-        # Calculate token age
-        token_age = datetime.now() - self.token_created_at
-        token_lifetime = timedelta(minutes=self.token_lifetime_minutes)
-
-        # Add a buffer to avoid edge cases
-        buffer_time = timedelta(minutes=self.expiration_buffer_minutes)
-        return token_age >= (token_lifetime - buffer_time)
+        # Token age in seconds, with a buffer to avoid edge cases; with a refresh ratio,
+        # expire at that fraction of the lifetime if it comes before the buffer
+        token_age = time.monotonic() - self.token_created_at
+        lifetime_seconds = self.token_lifetime_minutes * 60.0
+        ratio = self.token_refresh_ratio if self.token_refresh_ratio is not None else 1.0
+        usable_seconds = lifetime_seconds - self.expiration_buffer_minutes * 60.0
+        usable_seconds = min(usable_seconds, lifetime_seconds * ratio)
+        if usable_seconds <= 0:
+            # Token shorter than the buffer: keep a usable window instead of expiring at once
+            usable_seconds = lifetime_seconds * ratio
+        return token_age >= usable_seconds
 
     def is_token_valid(self) -> bool:
         """Check if the token is valid (not expired)"""
@@ -52,28 +125,45 @@ class TokenManager(QObject):
 
     def get_time_until_expiry(self) -> timedelta:
         """Get the time remaining until token expires"""
-        if not self.token_created_at:
+        if self.token_created_at is None:
             return timedelta(0)
 
-        token_age = datetime.now() - self.token_created_at
-        token_lifetime = timedelta(minutes=self.token_lifetime_minutes)
-        remaining_time = token_lifetime - token_age
+        token_age = time.monotonic() - self.token_created_at
+        remaining_seconds = self.token_lifetime_minutes * 60.0 - token_age
 
-        return max(remaining_time, timedelta(0))
+        return timedelta(seconds=max(remaining_seconds, 0.0))
 
     def validate_token_with_api(self) -> bool:
         """
         Validate the token by making a test API call.
         Returns True if token is valid, False otherwise.
+        Called from check_and_handle_expiration(validate_with_api=True), i.e. the dialog's token timer.
         """
         if not self.access_token:
             return False
 
         try:
-            headers = {"Authorization": f"Bearer {self.access_token}"}
-            # Use a lightweight endpoint to test token validity
+            # HEAD on a lightweight endpoint: the status is all we need, not the jobs payload
             test_url = f"{self.api_base_url}{self.config.api_endpoints['jobs_list']}"
-            response = requests.get(test_url, headers=headers, timeout=self.api_validation_timeout)
+            response = None
+            if self._head_supported:
+                response = self.session.head(
+                    test_url,
+                    headers=self.auth_header,
+                    timeout=self.api_validation_timeout,
+                    allow_redirects=False,
+                )
+                if response.status_code in (405, 501):
+                    # HEAD not supported by the server: remember it and use GET from now on
+                    self._head_supported = False
+                    response = None
+            if response is None:
+                response = self.session.get(
+                    test_url,
+                    headers=self.auth_header,
+                    params={"limit": 1},
+                    timeout=self.api_validation_timeout,
+                )
 
             if response.status_code == 401:
                 # Token is invalid/expired
@@ -92,17 +182,19 @@ class TokenManager(QObject):
             # Other error, assume token is still valid
             return True
 
-    def check_and_handle_expiration(self) -> bool:
+    def check_and_handle_expiration(self, validate_with_api: bool = False) -> bool:
         """
         Check if token is expired and emit appropriate signals.
         Returns True if token is still valid, False if expired.
+        The server is only probed when validate_with_api is set (the dialog's periodic check),
+        so per-request checks stay local.
         """
         if self.is_token_expired():
             self.token_expired.emit()
             return False
 
         # Also validate with API to catch server-side token expiration
-        if not self.validate_token_with_api():
+        if validate_with_api and not self.validate_token_with_api():
             self.token_expired.emit()
             return False
 
@@ -111,4 +203,7 @@ class TokenManager(QObject):
     def clear_token(self):
         """Clear the stored token and creation time"""
         self.access_token = None
+        self.auth_header = None
         self.token_created_at = None
+        if self._bind_session:
+            self.session.headers.pop("Authorization", None)